@@ -5,19 +5,30 @@ import hashlib
 import json
 import threading
 import time
+from collections import deque
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
-from typing import Iterable, Dict
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 
 CACHE_ROOT = Path.home() / ".novel_player"
 MP3_DIR = CACHE_ROOT / "mp3"
 LOG_DIR = CACHE_ROOT / "logs"
 
-_executor = ThreadPoolExecutor(max_workers=4)
+MAX_WORKERS = 4
+# edge-tts 默认输出 audio-24khz-48kbitrate-mono-mp3，每秒约 6000 字节
+MP3_BYTES_PER_SECOND = 6000
+# 每个 voice/rate 保留最近多少条合成耗时样本
+RTF_SAMPLE_SIZE = 20
+# 启动时只读取最新日志末尾这么多字节（单条日志约 300 字节）
+LOG_TAIL_BYTES = 64 * 1024
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 _inflight: Dict[Path, Future] = {}
 _lock = threading.Lock()
+_rtf_samples: Dict[Tuple[str, str], Deque[float]] = {}
+_rtf_loaded = False
 
 
 def _ensure_dirs() -> None:
@@ -73,16 +84,95 @@ def _download_and_log(text: str, voice: str, rate: str, path: Path) -> None:
     start_ts = datetime.now().isoformat()
     _download_tts(text=text, voice=voice, rate=rate, path=path)
     end = time.time()
+    duration = end - start
+    audio_duration = estimate_audio_duration(path)
     log_line = {
         "start": start_ts,
         "end": datetime.now().isoformat(),
-        "duration": round(end - start, 3),
+        "duration": round(duration, 3),
+        "audio_duration": round(audio_duration, 3),
         "voice": voice,
         "rate": rate,
         "text_preview": text[:20],
         "mp3_path": str(path),
     }
     _write_log(log_line)
+    if audio_duration > 0:
+        _record_rtf(voice, rate, duration / audio_duration)
+
+
+def estimate_audio_duration(path: Path) -> float:
+    """按固定码率估算 mp3 时长（秒），文件不存在时返回 0。"""
+    try:
+        return path.stat().st_size / MP3_BYTES_PER_SECOND
+    except OSError:
+        return 0.0
+
+
+def measured_rtf(voice: str, rate: str) -> Optional[float]:
+    """返回最近合成耗时与音频时长之比（实时率），没有样本时返回 None。"""
+    _load_rtf_from_logs()
+    with _lock:
+        samples = _rtf_samples.get((voice, rate))
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+
+def _record_rtf(voice: str, rate: str, rtf: float) -> None:
+    with _lock:
+        samples = _rtf_samples.setdefault((voice, rate), deque(maxlen=RTF_SAMPLE_SIZE))
+        samples.append(rtf)
+
+
+def _load_rtf_from_logs() -> None:
+    """首次使用时从最新日志的末尾恢复样本，排在运行中实测的样本之前。"""
+    global _rtf_loaded
+    with _lock:
+        if _rtf_loaded:
+            return
+    loaded: Dict[Tuple[str, str], Deque[float]] = {}
+    for line in _read_log_tail():
+        try:
+            entry = json.loads(line)
+            duration = float(entry["duration"])
+            audio_duration = float(entry.get("audio_duration") or 0)
+            if audio_duration <= 0:
+                # 旧日志没有 audio_duration，按 mp3 文件大小估算
+                audio_duration = estimate_audio_duration(Path(entry["mp3_path"]))
+            if audio_duration > 0:
+                key = (str(entry["voice"]), str(entry["rate"]))
+                loaded.setdefault(key, deque(maxlen=RTF_SAMPLE_SIZE)).append(duration / audio_duration)
+        except Exception:
+            # 单行损坏直接跳过
+            continue
+    with _lock:
+        if _rtf_loaded:
+            return
+        for key, samples in loaded.items():
+            live = _rtf_samples.get(key, ())
+            _rtf_samples[key] = deque([*samples, *live], maxlen=RTF_SAMPLE_SIZE)
+        _rtf_loaded = True
+
+
+def _read_log_tail(max_bytes: int = LOG_TAIL_BYTES) -> List[str]:
+    _ensure_dirs()
+    log_files = sorted(LOG_DIR.glob("tts_*.log"))
+    if not log_files:
+        return []
+    try:
+        with log_files[-1].open("rb") as fp:
+            fp.seek(0, 2)
+            size = fp.tell()
+            fp.seek(max(0, size - max_bytes))
+            data = fp.read()
+    except Exception:
+        return []
+    lines = data.decode("utf-8", errors="ignore").splitlines()
+    if size > max_bytes and lines:
+        # 第一行可能被截断
+        lines = lines[1:]
+    return lines
 
 
 def _download_tts(text: str, voice: str, rate: str, path: Path) -> None:
@@ -6,9 +6,13 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict
 
+from cache import MAX_WORKERS
+
 
 CONFIG_DIR = Path.home() / ".novel_player"
 CONFIG_PATH = CONFIG_DIR / "config.json"
+# 线程池需给当前段留一个空位，预载段数不能占满全部线程
+MAX_PRELOAD_SEGMENTS = MAX_WORKERS - 1
 
 
 @dataclass
@@ -17,6 +21,7 @@ class Config:
     rate: str = "+20%"
     split_type: str = "简单"
     preload_segments: int = 2
+    preload_max_segments: int = MAX_PRELOAD_SEGMENTS
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -25,6 +30,9 @@ class Config:
             rate=str(data.get("rate", cls.rate)),
             split_type=str(data.get("split_type", cls.split_type)),
             preload_segments=int(data.get("preload_segments", cls.preload_segments)),
+            preload_max_segments=max(
+                1, min(int(data.get("preload_max_segments", cls.preload_max_segments)), MAX_PRELOAD_SEGMENTS)
+            ),
         )
 
     def to_dict(self) -> Dict[str, Any]:
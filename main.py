@@ -10,6 +10,7 @@ from typing import Optional
 import cache
 from book import Book, load_book
 from config import Config, CONFIG_PATH, load_config, save_config, validate_rate
+from prefetch import PrefetchPlanner
 from progress import load_progress, save_progress
 from player import Player
 
@@ -57,7 +58,8 @@ def reading_mode(txt_path: str) -> None:
     player = Player(config.voice, config.rate)
     resolved_path = Path(txt_path).expanduser().resolve()
     current_idx = _load_start_index(resolved_path, book, config)
-    _preload_and_play(book, current_idx, config, player, autoplay=True)
+    planner = PrefetchPlanner(config.preload_segments, config.preload_max_segments)
+    _preload_and_play(book, current_idx, config, player, planner, autoplay=True)
     save_progress(resolved_path, config.split_type, current_idx)
 
     prev_state = player.state
@@ -80,12 +82,14 @@ def reading_mode(txt_path: str) -> None:
                 break
             if key in {"UP", "LEFT"} and current_idx > 0:
                 current_idx -= 1
-                _preload_and_play(book, current_idx, config, player, autoplay=True)
+                planner.record_move(-1, manual=True)
+                _preload_and_play(book, current_idx, config, player, planner, autoplay=True)
                 save_progress(resolved_path, config.split_type, current_idx)
                 redraw = True
             elif key in {"DOWN", "RIGHT"} and current_idx < len(book.segments) - 1:
                 current_idx += 1
-                _preload_and_play(book, current_idx, config, player, autoplay=True)
+                planner.record_move(1, manual=True)
+                _preload_and_play(book, current_idx, config, player, planner, autoplay=True)
                 save_progress(resolved_path, config.split_type, current_idx)
                 redraw = True
             elif key == "SPACE":
@@ -103,7 +107,8 @@ def reading_mode(txt_path: str) -> None:
             if prev_state == "PLAYING" and player.state == "STOPPED" and not manual_stop:
                 if current_idx < len(book.segments) - 1:
                     current_idx += 1
-                    _preload_and_play(book, current_idx, config, player, autoplay=True)
+                    planner.record_move(1, manual=False)
+                    _preload_and_play(book, current_idx, config, player, planner, autoplay=True)
                     save_progress(resolved_path, config.split_type, current_idx)
                     redraw = True
             if (
@@ -125,16 +130,12 @@ def reading_mode(txt_path: str) -> None:
     save_progress(resolved_path, config.split_type, final_index)
 
 
-def _preload_neighbors(book: Book, index: int, config: Config) -> None:
-    window = config.preload_segments
-    texts = []
-    for offset in range(1, window + 1):
-        prev_idx = index - offset
-        next_idx = index + offset
-        if prev_idx >= 0:
-            texts.append(book.segments[prev_idx].text)
-        if next_idx < len(book.segments):
-            texts.append(book.segments[next_idx].text)
+def _preload_neighbors(book: Book, index: int, config: Config, planner: PrefetchPlanner) -> None:
+    rtf = cache.measured_rtf(config.voice, config.rate)
+    # 当前段排在本批最前；预载段数上限比线程数少一，线程池总有空位留给当前段
+    texts = [book.segments[index].text]
+    for idx in planner.plan(index, len(book.segments), rtf):
+        texts.append(book.segments[idx].text)
     cache.preload_segments(texts, config.voice, config.rate)
 
 def _load_start_index(path: Path, book: Book, config: Config) -> int:
@@ -155,11 +156,15 @@ def _play_segment(text: str, player: Player) -> bool:
         return False
 
 
-def _preload_and_play(book: Book, index: int, config: Config, player: Player, autoplay: bool) -> None:
+def _preload_and_play(
+    book: Book, index: int, config: Config, player: Player, planner: PrefetchPlanner, autoplay: bool
+) -> None:
     player.stop()
-    _preload_neighbors(book, index, config)
+    _preload_neighbors(book, index, config, planner)
     if autoplay:
         _play_segment(book.segments[index].text, player)
+        # 当前段合成完成后实时率可能刚有实测值，按新窗口补齐预载
+        _preload_neighbors(book, index, config, planner)
 
 
 def render(book: Book, current_idx: int, player: Player, config: Config) -> None:
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import List, Optional, Tuple
+
+
+# 两次手动切段间隔小于该秒数视为快速跳读
+SKIM_INTERVAL = 3.0
+# 合成耗时波动较大，预留 50% 余量
+SAFETY_MARGIN = 1.5
+
+
+class PrefetchPlanner:
+    """根据实测合成实时率与翻页习惯，决定前后各预载多少段。"""
+
+    def __init__(self, base_window: int, max_window: int) -> None:
+        self.base_window = max(0, base_window)
+        self.max_window = max(1, max_window)
+        self._last_manual_at: Optional[float] = None
+        self.skimming = False
+        self.direction = 1
+
+    def record_move(self, step: int, *, manual: bool, now: float | None = None) -> None:
+        """记录一次切段；自动播放到下一段视为顺序收听。"""
+        now = time.monotonic() if now is None else now
+        if not manual:
+            self.skimming = False
+            self.direction = 1
+            self._last_manual_at = None
+            return
+        self.skimming = self._last_manual_at is not None and now - self._last_manual_at < SKIM_INTERVAL
+        self.direction = 1 if step >= 0 else -1
+        self._last_manual_at = now
+
+    def windows(self, rtf: Optional[float]) -> Tuple[int, int]:
+        """返回 (向后预载段数, 向前预载段数)，总数不超过 max_window。"""
+        if self.skimming:
+            # 跳读时只准备行进方向的下一段，避免白白请求
+            return (1, 0) if self.direction > 0 else (0, 1)
+        if rtf is None:
+            # 还没有实测数据，按配置窗口全部向后预载，向前最多一段
+            forward = min(self.base_window, self.max_window)
+            return forward, min(1, self.base_window, self.max_window - forward)
+        # 第 k 段在当前段开始播放时提交，需在 k 段音频时长内合成完毕，即 k >= rtf
+        forward = min(max(1, math.ceil(rtf * SAFETY_MARGIN)), self.max_window)
+        backward = 1 if forward < self.max_window else 0
+        return forward, backward
+
+    def plan(self, index: int, total: int, rtf: Optional[float]) -> List[int]:
+        """按优先级返回需要预载的段落下标（不含当前段），近处优先、前向优先。"""
+        forward, backward = self.windows(rtf)
+        indices: List[int] = []
+        for offset in range(1, max(forward, backward) + 1):
+            next_idx = index + offset
+            prev_idx = index - offset
+            if offset <= forward and next_idx < total:
+                indices.append(next_idx)
+            if offset <= backward and prev_idx >= 0:
+                indices.append(prev_idx)
+        return indices
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import cache
+import main
+from book import Book, Segment
+from config import Config, MAX_PRELOAD_SEGMENTS
+from prefetch import PrefetchPlanner, SKIM_INTERVAL
+
+
+# 模拟中每段音频的时长（秒），按比例缩短以加快测试
+AUDIO_SECONDS = 0.12
+SEGMENT_COUNT = 25
+
+
+class FakePlayer:
+    """只负责等待 mp3 就绪的播放器，播放时间由模拟循环 sleep 代替。"""
+
+    def __init__(self, voice: str, rate: str) -> None:
+        self.voice = voice
+        self.rate = rate
+
+    def play_text(self, text: str, *, autoplay: bool = True) -> Path:
+        return cache.ensure_mp3(text, self.voice, self.rate)
+
+    def stop(self) -> None:
+        pass
+
+
+class PrefetchPlannerTest(unittest.TestCase):
+    def test_warm_up_biases_forward(self) -> None:
+        planner = PrefetchPlanner(base_window=2, max_window=3)
+        self.assertEqual(planner.windows(None), (2, 1))
+        self.assertEqual(planner.plan(5, 10, None), [6, 4, 7])
+
+    def test_window_follows_rtf_within_cap(self) -> None:
+        planner = PrefetchPlanner(base_window=2, max_window=3)
+        self.assertEqual(planner.windows(0.2), (1, 1))
+        self.assertEqual(planner.windows(1.0), (2, 1))
+        self.assertEqual(planner.windows(5.0), (3, 0))
+
+    def test_skimming_keeps_only_next_segment(self) -> None:
+        planner = PrefetchPlanner(base_window=2, max_window=3)
+        planner.record_move(1, manual=True, now=0.0)
+        self.assertFalse(planner.skimming)
+        planner.record_move(-1, manual=True, now=SKIM_INTERVAL / 2)
+        self.assertTrue(planner.skimming)
+        self.assertEqual(planner.plan(5, 10, 2.0), [4])
+        planner.record_move(1, manual=False)
+        self.assertEqual(planner.plan(5, 10, 2.0), [6, 7, 8])
+
+    def test_config_clamps_max_segments(self) -> None:
+        self.assertEqual(Config.from_dict({"preload_max_segments": 0}).preload_max_segments, 1)
+        self.assertEqual(Config.from_dict({"preload_max_segments": 99}).preload_max_segments, MAX_PRELOAD_SEGMENTS)
+
+
+class SequentialListeningSimulationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for name, value in {
+            "CACHE_ROOT": root,
+            "MP3_DIR": root / "mp3",
+            "LOG_DIR": root / "logs",
+            "_inflight": {},
+            "_rtf_samples": {},
+            "_rtf_loaded": False,
+        }.items():
+            patcher = mock.patch.object(cache, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _simulate(self, rtf: float) -> int:
+        def fake_download(text: str, voice: str, rate: str, path: Path) -> None:
+            time.sleep(rtf * AUDIO_SECONDS)
+            path.write_bytes(b"\0" * int(AUDIO_SECONDS * cache.MP3_BYTES_PER_SECOND))
+
+        config = Config()
+        book = Book(title="sim", segments=[Segment(i, None, f"{rtf} {i}") for i in range(SEGMENT_COUNT)])
+        player = FakePlayer(config.voice, config.rate)
+        planner = PrefetchPlanner(config.preload_segments, config.preload_max_segments)
+        stalls = 0
+        with mock.patch.object(cache, "_download_tts", fake_download):
+            main._preload_and_play(book, 0, config, player, planner, autoplay=True)
+            for index in range(1, SEGMENT_COUNT):
+                time.sleep(AUDIO_SECONDS)
+                if not cache.get_mp3_path(book.segments[index].text, config.voice, config.rate).exists():
+                    stalls += 1
+                planner.record_move(1, manual=False)
+                main._preload_and_play(book, index, config, player, planner, autoplay=True)
+        return stalls
+
+    def test_no_stalls_across_latency_profiles(self) -> None:
+        for rtf in (0.2, 0.8, 1.5, 2.5):
+            with self.subTest(rtf=rtf):
+                self.assertEqual(self._simulate(rtf), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()